@@ -1,22 +1,42 @@
+import time
+from collections import namedtuple
+
 import psutil
 
 
+# A single battery reading. Use ``._asdict()`` where a plain dict is needed.
+BatteryInfo = namedtuple('BatteryInfo', ['percent', 'power_plugged'])
+
+# How long (in seconds) a battery reading is reused before psutil is queried again.
+BATTERY_INFO_TTL = 2
+
+_battery_info_cache = {'value': None, 'expires': 0.0}
+
+
 # Function to get battery information
 def get_battery_info():
     """Get the battery status.
 
+    Readings are cached for ``BATTERY_INFO_TTL`` seconds, so rapid re-polls do
+    not hit the OS again.
+
     Returns:
-        battery_info (dict): A dictionary containing battery percentage and whether it's charging or not.
+        battery_info (BatteryInfo): A named tuple containing battery percentage and whether it's charging or not.
     """
+    now = time.monotonic()
+    if _battery_info_cache['value'] is not None and now < _battery_info_cache['expires']:
+        return _battery_info_cache['value']
+
     battery = psutil.sensors_battery()
     if battery is not None:
-        battery_info = {
-            'percent': battery.percent,
-            'power_plugged': battery.power_plugged
-        }
-        return battery_info
+        battery_info = BatteryInfo(battery.percent, battery.power_plugged)
     else:
-        return "No battery information available."
+        battery_info = "No battery information available."
+
+    _battery_info_cache['value'] = battery_info
+    _battery_info_cache['expires'] = now + BATTERY_INFO_TTL
+
+    return battery_info
 
 
 # Get the current battery status
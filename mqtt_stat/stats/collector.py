@@ -0,0 +1,19 @@
+from mqtt_stat.stats.battery import BatteryInfo, get_battery_info
+from mqtt_stat.stats.network import get_network_name
+
+
+def collect_stats():
+    """Collect every stat in a single pass.
+
+    Returns:
+        stats (dict): A dictionary containing the battery status and the network name.
+    """
+    battery_info = get_battery_info()
+    if isinstance(battery_info, BatteryInfo):
+        # Keep the battery status a plain dict so the stats serialize to JSON objects.
+        battery_info = battery_info._asdict()
+
+    return {
+        'battery': battery_info,
+        'network': get_network_name(),
+    }
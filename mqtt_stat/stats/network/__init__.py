@@ -1,40 +1,122 @@
 import subprocess
 import platform
+import threading
+import time
 
 
 class NetworkInfo:
     """Base class for fetching network information."""
 
     def get_network_name(self):
-        """Method to get the network name. Needs to be overridden by subclasses."""
+        """Method to get the network name. Needs to be overridden by subclasses.
+
+        Implementations return "Not connected to a network." when there is no
+        connection, and None when the lookup itself failed.
+        """
         raise NotImplementedError("Subclasses should implement this method")
 
 
+# How long (in seconds) a lookup tool may run before it is treated as failed.
+# Kept well below NETWORK_NAME_TTL so a hung tool can't stall refreshes.
+NETWORK_LOOKUP_TIMEOUT = 10
+
+
+def _lazy_win():
+    from mqtt_stat.stats.network.win import WindowsNetworkInfo
+    return WindowsNetworkInfo()
+
+
+def _lazy_mac():
+    from mqtt_stat.stats.network.mac_os import MacOSNetworkInfo
+    return MacOSNetworkInfo()
+
+
+def _lazy_linux():
+    from mqtt_stat.stats.network.linux import LinuxNetworkInfo
+    return LinuxNetworkInfo()
+
+
+_NETWORK_INFO_FACTORIES = {
+    'Windows': _lazy_win,
+    'Darwin': _lazy_mac,
+    'Linux': _lazy_linux,
+}
+
+# The OS cannot change during the life of the process, so resolve it once.
+OS_NAME = platform.system()
+
+
 def get_network_info_class():
     """Factory function to get the appropriate network info class based on the OS."""
-    os_name = platform.system()
+    factory = _NETWORK_INFO_FACTORIES.get(OS_NAME)
+    if factory is None:
+        raise ValueError(f"Unsupported operating system: {OS_NAME}")
 
-    if os_name == 'Windows':
-        from mqtt_stat.stats.network.win import WindowsNetworkInfo
-        return WindowsNetworkInfo()
+    return factory()
 
-    elif os_name == 'Darwin':
-        from mqtt_stat.stats.network.mac_os import MacOSNetworkInfo
-        return MacOSNetworkInfo()
 
-    elif os_name == 'Linux':
-        from mqtt_stat.stats.network.linux import LinuxNetworkInfo
-        return LinuxNetworkInfo()
-    else:
-        raise ValueError(f"Unsupported operating system: {os_name}")
+NETWORK_INFO = get_network_info_class()
 
+# How long (in seconds) a looked-up network name is considered fresh.
+NETWORK_NAME_TTL = 30
 
-NETWORK_INFO = get_network_info_class()
+_network_name_cache = {'value': None, 'expires': 0.0, 'refreshing': False}
+_network_name_lock = threading.Lock()
+# Serializes the synchronous first lookup so concurrent callers share one result.
+_network_name_first_lookup_lock = threading.Lock()
+
+
+def _refresh_network_name():
+    """Look up the network name and store it in the cache.
+
+    If the lookup fails, the previously cached value is kept.
+    """
+    try:
+        name = NETWORK_INFO.get_network_name()
+    except Exception:
+        name = None
+
+    with _network_name_lock:
+        if name is not None:
+            _network_name_cache['value'] = name
+            _network_name_cache['expires'] = time.monotonic() + NETWORK_NAME_TTL
+        _network_name_cache['refreshing'] = False
+
+    return name
 
 
 def get_network_name():
-    """Get the network name."""
-    return NETWORK_INFO.get_network_name()
+    """Get the network name.
+
+    The name is cached for ``NETWORK_NAME_TTL`` seconds. Once it goes stale the
+    old value is returned straight away while a background thread fetches a new
+    one, so callers never wait on the lookup tools after the first call.
+    """
+    with _network_name_lock:
+        cached = _network_name_cache['value']
+        if cached is not None and time.monotonic() < _network_name_cache['expires']:
+            return cached
+
+        if cached is not None:
+            if not _network_name_cache['refreshing']:
+                _network_name_cache['refreshing'] = True
+                try:
+                    threading.Thread(target=_refresh_network_name, daemon=True).start()
+                except RuntimeError:
+                    # Couldn't start the refresh, so let the next call try again.
+                    _network_name_cache['refreshing'] = False
+            return cached
+
+    # Nothing cached yet, so look it up synchronously. Callers arriving while
+    # the first lookup runs wait for it and reuse its result.
+    with _network_name_first_lookup_lock:
+        cached = _network_name_cache['value']
+        if cached is not None:
+            return cached
+
+        name = _refresh_network_name()
+
+    return name if name is not None else "Not connected to a network."
 
 
 # Instantiate the appropriate class and get the network name.
@@ -1,5 +1,29 @@
+import os
+import re
 import subprocess
-from mqtt_stat.stats.network import NetworkInfo
+from mqtt_stat.stats.network import NETWORK_LOOKUP_TIMEOUT, NetworkInfo
+
+
+SYS_CLASS_NET = '/sys/class/net'
+
+# nmcli's terse mode escapes ':' and '\\' with a backslash.
+_NMCLI_ESCAPE_RE = re.compile(r'\\(.)')
+
+
+def has_wireless_interface():
+    """Check sysfs for a wireless network interface without spawning a process."""
+    try:
+        interfaces = os.listdir(SYS_CLASS_NET)
+    except OSError:
+        # Can't tell, so let nmcli decide.
+        return True
+
+    for iface in interfaces:
+        iface_dir = os.path.join(SYS_CLASS_NET, iface)
+        if os.path.exists(os.path.join(iface_dir, 'wireless')) or os.path.exists(os.path.join(iface_dir, 'phy80211')):
+            return True
+
+    return False
 
 
 class LinuxNetworkInfo(NetworkInfo):
@@ -7,9 +31,21 @@ class LinuxNetworkInfo(NetworkInfo):
 
     def get_network_name(self):
         """Get the SSID of the currently connected network on Linux."""
-        command = "nmcli -t -f active,ssid dev wifi | egrep '^yes' | cut -d\: -f2"
-        try:
-            result = subprocess.check_output(command, shell=True).decode().strip()
-            return result if result else "Not connected to a network."
-        except subprocess.CalledProcessError:
+        if not has_wireless_interface():
             return "Not connected to a network."
+
+        command = ['nmcli', '-t', '-f', 'active,ssid', 'dev', 'wifi']
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, check=False,
+                                    timeout=NETWORK_LOOKUP_TIMEOUT)
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        # Find the active network in the terse output (e.g. "yes:MySSID")
+        for line in result.stdout.splitlines():
+            if line.startswith('yes:'):
+                return _NMCLI_ESCAPE_RE.sub(r'\1', line[4:]) or "Not connected to a network."
+        return "Not connected to a network."
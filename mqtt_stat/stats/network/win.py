@@ -1,5 +1,9 @@
+import re
 import subprocess
-from mqtt_stat.stats.network import NetworkInfo
+from mqtt_stat.stats.network import NETWORK_LOOKUP_TIMEOUT, NetworkInfo
+
+
+_SSID_RE_WIN = re.compile(r'^[ \t]*SSID[ \t]*:[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
 
 
 class WindowsNetworkInfo(NetworkInfo):
@@ -7,12 +11,11 @@ class WindowsNetworkInfo(NetworkInfo):
 
     def get_network_name(self):
         """Get the SSID of the currently connected network on Windows."""
-        command = "netsh wlan show interfaces"
+        command = ["netsh", "wlan", "show", "interfaces"]
         try:
-            result = subprocess.check_output(command, shell=True).decode()
+            result = subprocess.check_output(command, timeout=NETWORK_LOOKUP_TIMEOUT).decode()
             # Look for the SSID in the command output
-            for line in result.split('\n'):
-                if "SSID" in line:
-                    return line.split(":")[1].strip()
-        except subprocess.CalledProcessError:
-            return "Not connected to a network."
+            match = _SSID_RE_WIN.search(result)
+            return match.group(1) if match and match.group(1) else "Not connected to a network."
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            return None